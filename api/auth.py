@@ -2,22 +2,32 @@
 Simple authentication system for the betting monitor
 """
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-import json
+import orjson
+import time
 from pathlib import Path
 import config
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=config.BCRYPT_ROUNDS
+)
 security = HTTPBearer()
 
 # Simple file-based user storage (for simplicity - use database in production)
 USERS_FILE = config.DATA_DIR / "users.json"
 
+# Parsed users.json, reused until the file's mtime changes
+_users_cache: Optional[dict] = None
+_users_cache_mtime: Optional[int] = None
+
 
 class Token(BaseModel):
     access_token: str
@@ -41,9 +51,21 @@ class UserCreate(BaseModel):
     is_admin: bool = False
 
 
+def _copy_users(users: dict) -> dict:
+    """Copy the users mapping so callers can't mutate the cache in place"""
+    return {username: dict(user) for username, user in users.items()}
+
+
 def load_users() -> dict:
-    """Load users from JSON file"""
-    if not USERS_FILE.exists():
+    """Load users from JSON file (cached until the file changes on disk)"""
+    global _users_cache, _users_cache_mtime
+
+    try:
+        mtime = USERS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    if mtime is None:
         # Create default admin user
         default_users = {
             "admin": {
@@ -56,14 +78,27 @@ def load_users() -> dict:
         save_users(default_users)
         return default_users
 
-    with open(USERS_FILE, 'r') as f:
-        return json.load(f)
+    if _users_cache is not None and mtime == _users_cache_mtime:
+        return _copy_users(_users_cache)
+
+    with open(USERS_FILE, 'rb') as f:
+        users = orjson.loads(f.read())
+
+    _users_cache = users
+    _users_cache_mtime = mtime
+    return _copy_users(users)
 
 
 def save_users(users: dict):
     """Save users to JSON file"""
-    with open(USERS_FILE, 'w') as f:
-        json.dump(users, f, indent=2)
+    global _users_cache, _users_cache_mtime
+
+    with open(USERS_FILE, 'wb') as f:
+        f.write(orjson.dumps(users, option=orjson.OPT_INDENT_2))
+
+    # Only cache once the write succeeded, and keep our own copy
+    _users_cache = _copy_users(users)
+    _users_cache_mtime = USERS_FILE.stat().st_mtime_ns
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -105,21 +140,38 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def decode_token(token: str) -> Optional[TokenData]:
-    """Decode and validate a JWT token"""
+@lru_cache(maxsize=4096)
+def _decode_token_cached(token: str) -> Optional[Tuple[TokenData, Optional[int]]]:
+    """Verify and decode a JWT once per distinct token string"""
     try:
         payload = jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
-        username: str = payload.get("sub")
-        is_admin: bool = payload.get("is_admin", False)
+    except JWTError:
+        return None
 
-        if username is None:
-            return None
+    username: str = payload.get("sub")
+    is_admin: bool = payload.get("is_admin", False)
 
-        return TokenData(username=username, is_admin=is_admin)
+    if username is None:
+        return None
 
-    except JWTError:
+    return TokenData(username=username, is_admin=is_admin), payload.get("exp")
+
+
+def decode_token(token: str) -> Optional[TokenData]:
+    """Decode and validate a JWT token"""
+    decoded = _decode_token_cached(token)
+
+    if decoded is None:
+        return None
+
+    token_data, expires_at = decoded
+
+    # Cached entries outlive the token, so re-check expiry on every hit
+    if expires_at is not None and expires_at <= time.time():
         return None
 
+    return token_data
+
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
     """Get the current authenticated user"""
@@ -143,7 +195,12 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             detail="User not found or disabled"
         )
 
-    return User(**user)
+    # Stored users were validated when created, so skip re-validation here
+    return User.model_construct(
+        username=user["username"],
+        is_admin=bool(user.get("is_admin", False)),
+        disabled=bool(user.get("disabled", False))
+    )
 
 
 async def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
@@ -184,7 +241,13 @@ def delete_user(username: str) -> bool:
 
     # Don't allow deleting the last admin
     if users[username].get("is_admin"):
-        admin_count = sum(1 for u in users.values() if u.get("is_admin") and not u.get("disabled"))
+        # Only need to know whether a second active admin exists
+        admin_count = 0
+        for u in users.values():
+            if u.get("is_admin") and not u.get("disabled"):
+                admin_count += 1
+                if admin_count > 1:
+                    break
         if admin_count <= 1:
             return False
 
@@ -3,10 +3,17 @@ FastAPI Backend for NCAA Basketball Betting Monitor
 """
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
+import heapq
+from operator import itemgetter
+import time
+import orjson
 import config
 
 from api.auth import (
@@ -30,7 +37,8 @@ from utils.ppm_analyzer import get_ppm_analyzer
 app = FastAPI(
     title="NCAA Basketball Betting Monitor API",
     description="Real-time NCAA basketball betting intelligence platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -43,6 +51,30 @@ app.add_middleware(
 )
 
 
+class ExportGZipMiddleware:
+    """
+    Gzip the CSV export downloads for clients that accept it
+
+    Other routes are passed through untouched: /api/games/live serves one
+    cached body to every poller, and compressing it per request would redo
+    the work that cache saves.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/export/"):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=1024)
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["path"].startswith(self.path_prefix):
+            await self.gzip_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+app.add_middleware(ExportGZipMiddleware)
+
+
 # ========== MODELS ==========
 
 class LoginRequest(BaseModel):
@@ -112,73 +144,56 @@ async def get_me(current_user: User = Depends(get_current_user)):
 
 # ========== GAME DATA ENDPOINTS ==========
 
-@app.get("/api/games/live")
-async def get_live_games():  # Auth disabled for testing
-    """Get all live games with confidence scores"""
-    from datetime import datetime, timedelta
+# Serialized /api/games/live bodies shared by every poller within the window,
+# keyed by min_confidence as (expires_at, body)
+LIVE_GAMES_CACHE_SECONDS = 1.0
+_live_games_cache: Dict[float, tuple] = {}
 
-    csv_logger = get_csv_logger()
+# Games not updated within this window are no longer being monitored
+LIVE_GAME_WINDOW = timedelta(minutes=30)
 
-    # Get recent logs (last 100 entries)
-    logs = csv_logger.get_recent_logs(limit=100)
+# Most games shown on the triggered view
+TRIGGERED_GAMES_LIMIT = 50
 
-    # Group by game_id and get most recent entry for each game
-    games_dict = {}
 
-    for log in logs:
-        game_id = log.get("Game ID") or log.get("game_id")  # Support both new and old format
-        timestamp = log.get("Timestamp") or log.get("timestamp", "")
+@app.get("/api/games/live")
+async def get_live_games(min_confidence: float = 0):  # Auth disabled for testing
+    """Get all live games with confidence scores, optionally above a minimum"""
+    now = time.monotonic()
+    cached = _live_games_cache.get(min_confidence)
+    if cached is not None and now < cached[0]:
+        return Response(content=cached[1], media_type="application/json")
 
-        # Only include if more recent or first entry
-        if game_id not in games_dict or timestamp > games_dict[game_id].get("Timestamp", games_dict[game_id].get("timestamp", "")):
-            games_dict[game_id] = log
+    csv_logger = get_csv_logger()
 
-    # Filter to only games updated in last 30 minutes (actively being monitored)
-    cutoff_time = datetime.now() - timedelta(minutes=30)
-    active_games = []
+    # Most recent entry for each game, already normalized to the frontend's
+    # field names when the logger parsed it
+    games_dict = await run_in_threadpool(csv_logger.get_latest_by_game)
 
+    # Keep games updated in last 30 minutes (actively being monitored) that
+    # meet min_confidence, parsing each confidence once for the sort below.
+    # Timestamps are written as naive ISO-8601, which sorts lexicographically,
+    # so comparing strings avoids parsing a datetime per game
+    cutoff_iso = (datetime.now() - LIVE_GAME_WINDOW).isoformat()
+    keyed = []
     for game in games_dict.values():
-        timestamp_str = game.get("Timestamp") or game.get("timestamp", "")
-        try:
-            game_time = datetime.fromisoformat(timestamp_str)
-            if game_time > cutoff_time:
-                active_games.append(game)
-        except:
-            # If timestamp parsing fails, skip this game
-            continue
+        if (game["timestamp"] or "") > cutoff_iso:
+            confidence = float(game["confidence_score"] or 0)
+            if confidence >= min_confidence:
+                keyed.append((confidence, game))
 
     # Sort by confidence score (highest first)
-    active_games.sort(key=lambda x: float(x.get("Confidence") or x.get("confidence_score", 0)), reverse=True)
-
-    # Map new column names to old names for frontend compatibility
-    mapped_games = []
-    for game in active_games:
-        mapped_game = {
-            "game_id": game.get("Game ID") or game.get("game_id"),
-            "home_team": game.get("Team 2") or game.get("home_team"),
-            "away_team": game.get("Team 1") or game.get("away_team"),
-            "home_score": game.get("Score 2") or game.get("home_score"),
-            "away_score": game.get("Score 1") or game.get("away_score"),
-            "total_points": int(game.get("Score 1", 0)) + int(game.get("Score 2", 0)),
-            "period": game.get("Period") or game.get("period"),
-            "minutes_remaining": game.get("Mins Remaining") or game.get("minutes_remaining"),
-            "seconds_remaining": game.get("Secs Remaining") or game.get("seconds_remaining"),
-            "ou_line": game.get("OU Line") or game.get("ou_line"),
-            "espn_closing_total": game.get("ESPN Closing Total") or game.get("espn_closing_total"),
-            "required_ppm": game.get("Required PPM") or game.get("required_ppm"),
-            "current_ppm": game.get("Current PPM") or game.get("current_ppm"),
-            "ppm_difference": game.get("PPM Diff") or game.get("ppm_difference"),
-            "projected_final_score": game.get("Projected Final") or game.get("projected_final_score"),
-            "total_time_remaining": game.get("Total Time Left") or game.get("total_time_remaining"),
-            "bet_type": game.get("Bet Type") or game.get("bet_type", ""),
-            "trigger_flag": game.get("Trigger") in ["YES", "True", True] or game.get("trigger_flag") in ["True", True],
-            "confidence_score": game.get("Confidence") or game.get("confidence_score", 0),
-            "unit_size": game.get("Units") or game.get("unit_size", 0),
-            "timestamp": game.get("Timestamp") or game.get("timestamp"),
-        }
-        mapped_games.append(mapped_game)
+    keyed.sort(key=itemgetter(0), reverse=True)
+    active_games = [game for _, game in keyed]
+
+    body = orjson.dumps({"games": active_games, "count": len(active_games)})
+
+    # Forget expired thresholds so arbitrary query values can't pile up
+    for key in [k for k, (expires, _) in _live_games_cache.items() if expires <= now]:
+        del _live_games_cache[key]
+    _live_games_cache[min_confidence] = (now + LIVE_GAMES_CACHE_SECONDS, body)
 
-    return {"games": mapped_games, "count": len(mapped_games)}
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/games/triggered")
@@ -186,25 +201,21 @@ async def get_triggered_games():  # Auth disabled for testing
     """Get only games that have triggered (confidence > 40)"""
     csv_logger = get_csv_logger()
 
-    # Get recent logs
-    logs = csv_logger.get_recent_logs(limit=200)
-
-    # Filter triggered games (confidence > 40) and get most recent for each
-    games_dict = {}
-
-    for log in logs:
-        if log.get("trigger_flag") == "True":
-            confidence = float(log.get("confidence_score", 0))
+    # Latest normalized entry per game (works for both CSV schemas)
+    games_dict = await run_in_threadpool(csv_logger.get_latest_by_game)
 
+    # Keep actively monitored games that are currently triggered (confidence > 40)
+    cutoff_iso = (datetime.now() - LIVE_GAME_WINDOW).isoformat()
+    candidates = []
+    for game in games_dict.values():
+        if game["trigger_flag"] and (game["timestamp"] or "") > cutoff_iso:
+            confidence = float(game["confidence_score"] or 0)
             if confidence > 40:
-                game_id = log.get("game_id")
-                timestamp = log.get("timestamp", "")
+                candidates.append((confidence, game))
 
-                if game_id not in games_dict or timestamp > games_dict[game_id].get("timestamp", ""):
-                    games_dict[game_id] = log
-
-    games = list(games_dict.values())
-    games.sort(key=lambda x: float(x.get("confidence_score", 0)), reverse=True)
+    # Highest confidence first; only the top few are displayed
+    top = heapq.nlargest(TRIGGERED_GAMES_LIMIT, candidates, key=itemgetter(0))
+    games = [game for _, game in top]
 
     return {"games": games, "count": len(games)}
 
@@ -214,38 +225,9 @@ async def get_game_history(game_id: str):  # Auth disabled for testing
     """Get historical data for a specific game"""
     csv_logger = get_csv_logger()
 
-    logs = csv_logger.get_recent_logs(limit=1000)
-
-    # Support both old and new column names
-    game_logs = [log for log in logs if (log.get("Game ID") or log.get("game_id")) == game_id]
-    game_logs.sort(key=lambda x: x.get("Timestamp") or x.get("timestamp", ""))
-
-    # Map new column names to old names for frontend compatibility
-    mapped_logs = []
-    for log in game_logs:
-        mapped_log = {
-            "game_id": log.get("Game ID") or log.get("game_id"),
-            "home_team": log.get("Team 2") or log.get("home_team"),
-            "away_team": log.get("Team 1") or log.get("away_team"),
-            "home_score": log.get("Score 2") or log.get("home_score"),
-            "away_score": log.get("Score 1") or log.get("away_score"),
-            "total_points": int(log.get("Score 1", 0) or 0) + int(log.get("Score 2", 0) or 0),
-            "period": log.get("Period") or log.get("period"),
-            "minutes_remaining": log.get("Mins Remaining") or log.get("minutes_remaining"),
-            "seconds_remaining": log.get("Secs Remaining") or log.get("seconds_remaining"),
-            "ou_line": log.get("OU Line") or log.get("ou_line"),
-            "required_ppm": log.get("Required PPM") or log.get("required_ppm"),
-            "current_ppm": log.get("Current PPM") or log.get("current_ppm"),
-            "ppm_difference": log.get("PPM Diff") or log.get("ppm_difference"),
-            "projected_final_score": log.get("Projected Final") or log.get("projected_final_score"),
-            "total_time_remaining": log.get("Total Time Left") or log.get("total_time_remaining"),
-            "bet_type": log.get("Bet Type") or log.get("bet_type", ""),
-            "trigger_flag": log.get("Trigger") in ["YES", "True", True] or log.get("trigger_flag") in ["True", True],
-            "confidence_score": log.get("Confidence") or log.get("confidence_score", 0),
-            "unit_size": log.get("Units") or log.get("unit_size", 0),
-            "timestamp": log.get("Timestamp") or log.get("timestamp"),
-        }
-        mapped_logs.append(mapped_log)
+    # Indexed by game and already mapped to the frontend's field names
+    mapped_logs = await run_in_threadpool(csv_logger.get_logs_for_game, game_id, limit=1000)
+    mapped_logs.sort(key=lambda x: x["timestamp"] or "")
 
     return {"game_id": game_id, "history": mapped_logs, "count": len(mapped_logs)}
 
@@ -255,24 +237,38 @@ async def get_completed_games(limit: Optional[int] = 20):
     """Get games with historical data from live log"""
     csv_logger = get_csv_logger()
 
-    # Get all logs and group by game_id
-    logs = csv_logger.get_recent_logs(limit=5000)
+    # Get all logs (normalized, with total_points parsed once at read time)
+    logs = await run_in_threadpool(csv_logger.get_recent_games, limit=5000)
 
-    # Group by game_id
-    games_by_id = {}
+    # First pass: only each game's most recent timestamp
+    last_seen = {}
     for log in logs:
-        game_id = log.get("Game ID") or log.get("game_id")
+        game_id = log["game_id"]
         if game_id:
-            if game_id not in games_by_id:
-                games_by_id[game_id] = []
-            games_by_id[game_id].append(log)
+            timestamp = log["timestamp"] or ""
+            last_seen[game_id] = max(timestamp, last_seen.get(game_id, ""))
+
+    # Most recently updated games first (top-N selection, no full sort)
+    if limit is None:
+        recent_game_ids = sorted(last_seen, key=last_seen.get, reverse=True)
+    else:
+        recent_game_ids = heapq.nlargest(limit, last_seen, key=last_seen.get)
+
+    # Second pass: gather history rows for the selected games only
+    games_by_id = {game_id: [] for game_id in recent_game_ids}
+    for log in logs:
+        game_logs = games_by_id.get(log["game_id"])
+        if game_logs is not None:
+            game_logs.append(log)
 
     # Build completed games list
     completed_games_with_history = []
 
-    for game_id, game_logs in list(games_by_id.items())[:limit]:
+    for game_id in recent_game_ids:
+        game_logs = games_by_id[game_id]
+
         # Sort by timestamp
-        game_logs.sort(key=lambda x: x.get("Timestamp") or x.get("timestamp", ""))
+        game_logs.sort(key=lambda x: x["timestamp"] or "")
 
         if not game_logs:
             continue
@@ -282,14 +278,14 @@ async def get_completed_games(limit: Optional[int] = 20):
         last_entry = game_logs[-1]
 
         # Extract team names and scores
-        away_team = first_entry.get("Team 1") or first_entry.get("away_team", "Unknown")
-        home_team = first_entry.get("Team 2") or first_entry.get("home_team", "Unknown")
+        away_team = first_entry["away_team"] or "Unknown"
+        home_team = first_entry["home_team"] or "Unknown"
 
-        final_away = int(last_entry.get("Score 1", 0) or 0)
-        final_home = int(last_entry.get("Score 2", 0) or 0)
-        final_total = final_away + final_home
+        final_away = int(last_entry["away_score"] or 0)
+        final_home = int(last_entry["home_score"] or 0)
+        final_total = last_entry["total_points"]
 
-        ou_line = float(last_entry.get("OU Line") or last_entry.get("ou_line", 0))
+        ou_line = float(last_entry["ou_line"] or 0)
 
         # Determine O/U result
         if final_total > ou_line:
@@ -300,19 +296,19 @@ async def get_completed_games(limit: Optional[int] = 20):
             ou_result = "push"
 
         # Get timestamp
-        timestamp = last_entry.get("Timestamp") or last_entry.get("timestamp", "")
+        timestamp = last_entry["timestamp"] or ""
         date = timestamp.split("T")[0] if timestamp else ""
 
         # Map historical data
         mapped_history = []
         for log in game_logs:
             mapped_log = {
-                "timestamp": log.get("Timestamp") or log.get("timestamp"),
-                "total_points": int(log.get("Score 1", 0) or 0) + int(log.get("Score 2", 0) or 0),
-                "ou_line": float(log.get("OU Line") or log.get("ou_line", 0)),
-                "period": log.get("Period") or log.get("period"),
-                "minutes_remaining": float(log.get("Mins Remaining") or log.get("minutes_remaining", 0)),
-                "bet_type": log.get("Bet Type") or log.get("bet_type", ""),
+                "timestamp": log["timestamp"],
+                "total_points": log["total_points"],
+                "ou_line": float(log["ou_line"] or 0),
+                "period": log["period"],
+                "minutes_remaining": float(log["minutes_remaining"] or 0),
+                "bet_type": log["bet_type"],
             }
             mapped_history.append(mapped_log)
 
@@ -326,7 +322,7 @@ async def get_completed_games(limit: Optional[int] = 20):
             "final_total": final_total,
             "ou_line": ou_line,
             "ou_result": ou_result,
-            "our_trigger": last_entry.get("Bet Type") or "",
+            "our_trigger": last_entry["bet_type"],
             "outcome": "",  # Not available without results CSV
             "unit_profit": 0,  # Not available without results CSV
             "history": mapped_history,
@@ -334,9 +330,6 @@ async def get_completed_games(limit: Optional[int] = 20):
 
         completed_games_with_history.append(completed_game)
 
-    # Sort by date/timestamp descending
-    completed_games_with_history.sort(key=lambda x: x.get("date", ""), reverse=True)
-
     return {"games": completed_games_with_history, "count": len(completed_games_with_history)}
 
 
@@ -346,7 +339,7 @@ async def get_completed_games(limit: Optional[int] = 20):
 async def get_performance_stats():  # Auth disabled for testing
     """Get betting performance statistics"""
     csv_logger = get_csv_logger()
-    stats = csv_logger.get_performance_stats()
+    stats = await run_in_threadpool(csv_logger.get_performance_stats)
     return stats
 
 
@@ -357,7 +350,7 @@ async def get_results(
 ):
     """Get game results history"""
     csv_logger = get_csv_logger()
-    results = csv_logger.get_results(limit=limit)
+    results = await run_in_threadpool(csv_logger.get_results, limit=limit)
 
     # Sort by date descending
     results.sort(key=lambda x: x.get("date", ""), reverse=True)
@@ -372,7 +365,7 @@ async def get_team_stats(
 ):
     """Get statistics for a specific team"""
     stats_manager = get_stats_manager()
-    metrics = stats_manager.get_team_metrics(team_name)
+    metrics = await run_in_threadpool(stats_manager.get_team_metrics, team_name)
 
     if not metrics:
         raise HTTPException(status_code=404, detail=f"Team not found: {team_name}")
@@ -393,7 +386,7 @@ async def get_ppm_analysis(
     Recommends optimal threshold based on historical performance
     """
     analyzer = get_ppm_analyzer()
-    analysis = analyzer.analyze_ppm_performance(days=days)
+    analysis = await run_in_threadpool(analyzer.analyze_ppm_performance, days=days)
     return analysis
 
 
@@ -419,14 +412,13 @@ async def get_daily_summary(
 
     if date:
         try:
-            from datetime import datetime
             target_date = datetime.fromisoformat(date)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
     else:
         target_date = None
 
-    summary = analyzer.generate_daily_summary(date=target_date)
+    summary = await run_in_threadpool(analyzer.generate_daily_summary, date=target_date)
     return summary
 
 
@@ -438,7 +430,7 @@ async def refresh_team_stats(
     stats_manager = get_stats_manager()
 
     try:
-        stats_manager.fetch_all_stats(force_refresh=True)
+        await run_in_threadpool(stats_manager.fetch_all_stats, force_refresh=True)
         return {"status": "success", "message": "Team stats refreshed"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
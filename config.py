@@ -7,23 +7,27 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Settings are read once at import, so resolve them against a plain dict
+# snapshot instead of going through os.environ for every lookup
+_ENV = dict(os.environ)
+
 # Base directory
 BASE_DIR = Path(__file__).parent
 
 # ========== DATA SOURCE CONFIGURATION ==========
 # Toggle between KenPom (paid) and ESPN (free)
-USE_KENPOM = os.getenv("USE_KENPOM", "false").lower() == "true"
+USE_KENPOM = _ENV.get("USE_KENPOM", "false").lower() == "true"
 
 # KenPom credentials (only needed if USE_KENPOM=true)
-KENPOM_EMAIL = os.getenv("KENPOM_EMAIL", "")
-KENPOM_PASSWORD = os.getenv("KENPOM_PASSWORD", "")
+KENPOM_EMAIL = _ENV.get("KENPOM_EMAIL", "")
+KENPOM_PASSWORD = _ENV.get("KENPOM_PASSWORD", "")
 
 # The Odds API key for live game data and odds
-ODDS_API_KEY = os.getenv("ODDS_API_KEY", "")
+ODDS_API_KEY = _ENV.get("ODDS_API_KEY", "")
 
 # ========== MONITORING CONFIGURATION ==========
 # Sport mode: "ncaa" or "nba" (for testing with live NBA games)
-SPORT_MODE = os.getenv("SPORT_MODE", "ncaa").lower()
+SPORT_MODE = _ENV.get("SPORT_MODE", "ncaa").lower()
 
 # Polling interval in seconds
 POLL_INTERVAL = 40  # 40 seconds
@@ -89,7 +93,10 @@ UNIT_SIZES = {
 # ========== DATABASE/STORAGE CONFIGURATION ==========
 # CSV file paths
 DATA_DIR = BASE_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
+# One stat() when the directory exists (the usual case) instead of a failing
+# mkdir() followed by a stat()
+if not DATA_DIR.is_dir():
+    DATA_DIR.mkdir(exist_ok=True)
 
 TEAM_STATS_FILE = DATA_DIR / "team_stats.csv"
 LIVE_LOG_FILE = DATA_DIR / "ncaa_live_log.csv"
@@ -97,42 +104,55 @@ RESULTS_FILE = DATA_DIR / "ncaa_results.csv"
 
 # Cache directory
 CACHE_DIR = BASE_DIR / "cache"
-CACHE_DIR.mkdir(exist_ok=True)
+if not CACHE_DIR.is_dir():
+    CACHE_DIR.mkdir(exist_ok=True)
 
 # ========== API CONFIGURATION ==========
 # FastAPI settings
-API_HOST = os.getenv("API_HOST", "0.0.0.0")
+API_HOST = _ENV.get("API_HOST", "0.0.0.0")
 # Render provides PORT env var, fallback to API_PORT or 8000
-API_PORT = int(os.getenv("PORT", os.getenv("API_PORT", "8000")))
-SECRET_KEY = os.getenv("SECRET_KEY", "change-this-in-production-please")
+API_PORT = int(_ENV.get("PORT", _ENV.get("API_PORT", "8000")))
+SECRET_KEY = _ENV.get("SECRET_KEY", "change-this-in-production-please")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
+# bcrypt cost factor for password hashing (passlib defaults to 12)
+BCRYPT_ROUNDS = int(_ENV.get("BCRYPT_ROUNDS", "10"))
 
 # CORS settings
-ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:3001,http://localhost:3002").split(",")
+ALLOWED_ORIGINS = _ENV.get("ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:3001,http://localhost:3002").split(",")
 
 # ========== LOGGING CONFIGURATION ==========
 LOG_DIR = BASE_DIR / "logs"
-LOG_DIR.mkdir(exist_ok=True)
+if not LOG_DIR.is_dir():
+    LOG_DIR.mkdir(exist_ok=True)
 
 LOG_FILE = LOG_DIR / "monitor.log"
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVEL = _ENV.get("LOG_LEVEL", "INFO")
 
 # ========== DEPLOYMENT CONFIGURATION ==========
-ENVIRONMENT = os.getenv("ENVIRONMENT", "development")  # development, production
+ENVIRONMENT = _ENV.get("ENVIRONMENT", "development")  # development, production
 IS_PRODUCTION = ENVIRONMENT == "production"
 
 # Railway backend URL (set in production)
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+BACKEND_URL = _ENV.get("BACKEND_URL", "http://localhost:8000")
 
 # Frontend URL (Vercel)
-FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
+FRONTEND_URL = _ENV.get("FRONTEND_URL", "http://localhost:3000")
 
 # ========== EMAIL CONFIGURATION ==========
-EMAIL_ENABLED = os.getenv("EMAIL_ENABLED", "false").lower() == "true"
-EMAIL_FROM = os.getenv("EMAIL_FROM", "")
-EMAIL_TO = os.getenv("EMAIL_TO", "")
-EMAIL_SMTP_SERVER = os.getenv("EMAIL_SMTP_SERVER", "smtp.gmail.com")
-EMAIL_SMTP_PORT = int(os.getenv("EMAIL_SMTP_PORT", "587"))
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
-DAILY_REPORT_TIME = os.getenv("DAILY_REPORT_TIME", "09:00")  # HH:MM format
+EMAIL_ENABLED = _ENV.get("EMAIL_ENABLED", "false").lower() == "true"
+EMAIL_FROM = _ENV.get("EMAIL_FROM", "")
+EMAIL_TO = _ENV.get("EMAIL_TO", "")
+EMAIL_SMTP_SERVER = _ENV.get("EMAIL_SMTP_SERVER", "smtp.gmail.com")
+EMAIL_SMTP_PORT = int(_ENV.get("EMAIL_SMTP_PORT", "587"))
+EMAIL_PASSWORD = _ENV.get("EMAIL_PASSWORD", "")
+DAILY_REPORT_TIME = _ENV.get("DAILY_REPORT_TIME", "09:00")  # HH:MM format
+
+# Report time parsed once here; falls back to 09:00 if not in HH:MM format
+# (DAILY_REPORT_TIME_VALID tells the scheduler to warn about the fallback)
+try:
+    DAILY_REPORT_HOUR, DAILY_REPORT_MINUTE = (int(part) for part in DAILY_REPORT_TIME.split(":"))
+    DAILY_REPORT_TIME_VALID = True
+except ValueError:
+    DAILY_REPORT_HOUR, DAILY_REPORT_MINUTE = 9, 0
+    DAILY_REPORT_TIME_VALID = False
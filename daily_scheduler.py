@@ -3,6 +3,7 @@ Daily Report Scheduler
 Runs daily performance analysis and emails report each morning
 """
 import asyncio
+import signal
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
@@ -20,15 +21,11 @@ class DailyScheduler:
         self.scheduler = AsyncIOScheduler()
         self.report_generator = get_report_generator()
 
-        # Parse report time (HH:MM format)
-        try:
-            hour, minute = config.DAILY_REPORT_TIME.split(":")
-            self.report_hour = int(hour)
-            self.report_minute = int(minute)
-        except:
+        # Report time (already parsed from DAILY_REPORT_TIME by config)
+        if not config.DAILY_REPORT_TIME_VALID:
             logger.warning(f"Invalid DAILY_REPORT_TIME format: {config.DAILY_REPORT_TIME}, using 09:00")
-            self.report_hour = 9
-            self.report_minute = 0
+        self.report_hour = config.DAILY_REPORT_HOUR
+        self.report_minute = config.DAILY_REPORT_MINUTE
 
     def run_daily_report(self):
         """Execute the daily report"""
@@ -69,14 +66,25 @@ class DailyScheduler:
         logger.success("Scheduler is running. Press Ctrl+C to exit.")
 
     async def run_forever(self):
-        """Keep the scheduler running"""
+        """Keep the scheduler running until SIGINT/SIGTERM"""
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                # Windows event loops don't support signal handlers
+                pass
+
         try:
-            # Keep the event loop running
-            while True:
-                await asyncio.sleep(60)
+            # APScheduler fires jobs on its own, so just stay suspended
+            # instead of waking the event loop periodically
+            await stop.wait()
         except (KeyboardInterrupt, SystemExit):
-            logger.info("Shutting down scheduler...")
-            self.scheduler.shutdown()
+            pass
+
+        logger.info("Shutting down scheduler...")
+        self.scheduler.shutdown()
 
 
 async def main():
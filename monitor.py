@@ -4,6 +4,7 @@ Enhanced with intelligent confidence scoring
 """
 import asyncio
 import requests
+import orjson
 from datetime import datetime
 from typing import List, Dict, Optional
 from loguru import logger
@@ -145,9 +146,9 @@ class NCAABettingMonitor:
                 # Log quota usage
                 requests_remaining = odds_response.headers.get('x-requests-remaining', 'unknown')
                 requests_used = odds_response.headers.get('x-requests-used', 'unknown')
-                logger.debug(f"API quota: {requests_used} used, {requests_remaining} remaining")
+                logger.debug("API quota: {} used, {} remaining", requests_used, requests_remaining)
 
-                odds_games = odds_response.json()
+                odds_games = orjson.loads(odds_response.content)
 
                 # Create map of team names to bookmakers
                 odds_map = {}
@@ -175,7 +176,7 @@ class NCAABettingMonitor:
 
                         if home_match and away_match:
                             bookmakers = odds_bookmakers
-                            logger.debug(f"Matched odds: {espn_away} @ {espn_home} <-> {odds_away} @ {odds_home}")
+                            logger.debug("Matched odds: {} @ {} <-> {} @ {}", espn_away, espn_home, odds_away, odds_home)
                             break
 
                     if bookmakers:
@@ -183,7 +184,7 @@ class NCAABettingMonitor:
                         espn_game['bookmakers'] = bookmakers
                         games_with_odds.append(espn_game)
                     else:
-                        logger.debug(f"No odds found for {espn_away} @ {espn_home}")
+                        logger.debug("No odds found for {} @ {}", espn_away, espn_home)
 
             except Exception as e:
                 logger.error(f"Error fetching odds from The Odds API: {e}")
@@ -214,7 +215,7 @@ class NCAABettingMonitor:
             url = self.espn_scoreboard_url
             response = requests.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             live_games = {}
 
@@ -244,7 +245,7 @@ class NCAABettingMonitor:
                         'event_id': event.get('id')
                     }
 
-            logger.debug(f"ESPN reports {len(live_games)} actually live games")
+            logger.debug("ESPN reports {} actually live games", len(live_games))
             return live_games
 
         except Exception as e:
@@ -261,7 +262,7 @@ class NCAABettingMonitor:
             url = self.espn_scoreboard_url
             response = requests.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             clock_data = {}
 
@@ -350,7 +351,7 @@ class NCAABettingMonitor:
                 clock_data[home_team] = game_clock_info
                 clock_data[away_team] = game_clock_info
 
-            logger.debug(f"Fetched ESPN clock data for {len(clock_data)//2} games")
+            logger.debug("Fetched ESPN clock data for {} games", len(clock_data)//2)
             return clock_data
 
         except Exception as e:
@@ -378,9 +379,9 @@ class NCAABettingMonitor:
             # Log quota usage from response headers
             requests_remaining = scores_response.headers.get('x-requests-remaining', 'unknown')
             requests_used = scores_response.headers.get('x-requests-used', 'unknown')
-            logger.debug(f"API quota: {requests_used} used, {requests_remaining} remaining")
+            logger.debug("API quota: {} used, {} remaining", requests_used, requests_remaining)
 
-            all_games = scores_response.json()
+            all_games = orjson.loads(scores_response.content)
 
             # Filter to only in-progress games (have scores but not completed)
             live_games = []
@@ -412,9 +413,9 @@ class NCAABettingMonitor:
             # Log quota usage
             requests_remaining = odds_response.headers.get('x-requests-remaining', 'unknown')
             requests_used = odds_response.headers.get('x-requests-used', 'unknown')
-            logger.debug(f"API quota after odds: {requests_used} used, {requests_remaining} remaining")
+            logger.debug("API quota after odds: {} used, {} remaining", requests_used, requests_remaining)
 
-            odds_games = odds_response.json()
+            odds_games = orjson.loads(odds_response.content)
 
             # Create a map of game_id -> bookmakers
             odds_map = {game["id"]: game.get("bookmakers", []) for game in odds_games}
@@ -482,10 +483,10 @@ class NCAABettingMonitor:
             ou_open = ou_line  # The Odds API doesn't provide opening lines in free tier
 
             if not ou_line:
-                logger.debug(f"No O/U line for {home_team} vs {away_team}")
+                logger.debug("No O/U line for {} vs {}", home_team, away_team)
                 return
 
-            logger.debug(f"Using ESPN data - {away_team} @ {home_team}: {away_score}-{home_score}, Period {period}, {time_remaining_minutes}:{time_remaining_seconds:02d} remaining")
+            logger.debug("Using ESPN data - {} @ {}: {}-{}, Period {}, {}:{:02d} remaining", away_team, home_team, away_score, home_score, period, time_remaining_minutes, time_remaining_seconds)
 
             # Calculate required PPM to hit over
             points_needed = ou_line - total_points
@@ -564,7 +565,7 @@ class NCAABettingMonitor:
                 if espn_odds:
                     espn_closing_total = espn_odds.get("closing_total")
             except Exception as e:
-                logger.debug(f"Could not fetch ESPN closing line for {game_id}: {e}")
+                logger.debug("Could not fetch ESPN closing line for {}: {}", game_id, e)
 
             # Prepare log data
             log_data = {
@@ -0,0 +1,183 @@
+"""
+Test script for the CSV logger's incremental live log tail
+"""
+import csv
+import io
+import os
+import random
+import tempfile
+from pathlib import Path
+
+import config
+from utils.csv_logger import CSVLogger, normalize_live_row
+
+
+def make_logger(live_log_path: Path) -> CSVLogger:
+    """CSVLogger on live_log_path that re-checks the file on every read"""
+    saved = config.LIVE_LOG_FILE, config.RESULTS_FILE
+    config.LIVE_LOG_FILE = live_log_path
+    config.RESULTS_FILE = live_log_path.with_name("results.csv")
+    try:
+        csv_logger = CSVLogger()
+    finally:
+        config.LIVE_LOG_FILE, config.RESULTS_FILE = saved
+
+    csv_logger.LIVE_REFRESH_SECONDS = 0
+    return csv_logger
+
+
+def poll(game_id: str, n: int, timestamp: str = None) -> dict:
+    """Minimal live poll for log_live_poll"""
+    return {
+        "game_id": game_id,
+        "away_team": f"Away {game_id}",
+        "home_team": f"Home {game_id}",
+        "away_score": n,
+        "home_score": n + 1,
+        "period": 1,
+        "bet_type": "under",
+        "trigger_flag": n % 2 == 0,
+        "timestamp": timestamp or f"2025-01-01T00:{n // 60 % 60:02d}:{n % 60:02d}",
+    }
+
+
+def full_parse(path: Path) -> list:
+    """Every row of the live log, parsed from scratch"""
+    with open(path, newline='') as f:
+        return [normalize_live_row(row) for row in csv.DictReader(f)]
+
+
+def expected_indexes(tail: list):
+    """Per-game rows and latest row per game, rebuilt from the tail"""
+    by_id, latest = {}, {}
+    for game in tail:
+        game_id = game["game_id"]
+        by_id.setdefault(game_id, []).append(game)
+        current = latest.get(game_id)
+        if current is None or (game["timestamp"] or "") > (current["timestamp"] or ""):
+            latest[game_id] = game
+    return by_id, latest
+
+
+def assert_matches_full_parse(csv_logger: CSVLogger):
+    """The cached tail and both per-game indexes agree with a full re-parse"""
+    tail = full_parse(csv_logger.live_log_path)[-csv_logger.LIVE_CACHE_ROWS:]
+    assert csv_logger.get_recent_games(limit=len(tail) + 1) == tail
+
+    by_id, latest = expected_indexes(tail)
+    assert {game_id: list(rows) for game_id, rows in csv_logger._games_by_id.items()} == by_id
+    assert csv_logger.get_latest_by_game() == latest
+    for game_id, rows in by_id.items():
+        assert csv_logger.get_logs_for_game(game_id) == rows
+
+
+def test_partial_row_is_picked_up_once_finished():
+    """A half-written row is held back until its newline arrives"""
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_logger = make_logger(Path(tmp) / "live.csv")
+        csv_logger.log_live_poll(poll("g1", 1))
+        assert len(csv_logger.get_recent_games()) == 1
+
+        # Format a full row, then append it in two writes
+        with open(csv_logger.live_log_path, newline='') as f:
+            header = next(csv.reader(f))
+        buf = io.StringIO()
+        csv.DictWriter(buf, fieldnames=header).writerow(
+            {"Team 1": "Late", "Score 1": 40, "Team 2": "Row", "Score 2": 2, "Game ID": "g2"}
+        )
+        row = buf.getvalue()
+
+        with open(csv_logger.live_log_path, 'a', newline='') as f:
+            f.write(row[:len(row) // 2])
+        assert [game["game_id"] for game in csv_logger.get_recent_games()] == ["g1"]
+
+        with open(csv_logger.live_log_path, 'a', newline='') as f:
+            f.write(row[len(row) // 2:])
+        games = csv_logger.get_recent_games()
+        assert [game["game_id"] for game in games] == ["g1", "g2"]
+        assert games[-1]["total_points"] == 42
+        assert_matches_full_parse(csv_logger)
+
+
+def test_replaced_or_truncated_file_is_reloaded():
+    """A new inode or a shrunken file drops the cache and re-reads from the header"""
+    with tempfile.TemporaryDirectory() as tmp:
+        live_log_path = Path(tmp) / "live.csv"
+        csv_logger = make_logger(live_log_path)
+        for n in range(5):
+            csv_logger.log_live_poll(poll(f"old{n % 2}", n))
+        assert len(csv_logger.get_recent_games()) == 5
+
+        # Replaced: a fresh log written elsewhere and renamed over the old one
+        writer = make_logger(Path(tmp) / "replacement.csv")
+        writer.log_live_poll(poll("new", 1))
+        os.replace(writer.live_log_path, live_log_path)
+        assert [game["game_id"] for game in csv_logger.get_recent_games()] == ["new"]
+        assert set(csv_logger.get_latest_by_game()) == {"new"}
+        assert csv_logger.get_logs_for_game("old0") == []
+        assert_matches_full_parse(csv_logger)
+
+        # Truncated in place: same inode, smaller than the parsed offset
+        with open(live_log_path, newline='') as f:
+            header_line = f.readline()
+        with open(live_log_path, 'w', newline='') as f:
+            f.write(header_line)
+        assert csv_logger.get_recent_games() == []
+        assert csv_logger.get_latest_by_game() == {}
+
+        csv_logger.log_live_poll(poll("after", 2))
+        assert [game["game_id"] for game in csv_logger.get_recent_games()] == ["after"]
+        assert_matches_full_parse(csv_logger)
+
+
+def test_trimming_keeps_game_indexes_consistent():
+    """Trimming past LIVE_CACHE_ROWS keeps _games_by_id and _latest_by_game in step"""
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_logger = make_logger(Path(tmp) / "live.csv")
+        csv_logger.LIVE_CACHE_ROWS = 7
+
+        n = 0
+        for _ in range(40):
+            # Several rows per refresh, some with out-of-order timestamps
+            for _ in range(rng.randint(1, 5)):
+                n += 1
+                game_id = f"g{rng.randint(0, 5)}"
+                timestamp = f"2025-01-01T00:00:{rng.randint(0, 59):02d}" if rng.random() < 0.2 else None
+                csv_logger.log_live_poll(poll(game_id, n, timestamp))
+            assert_matches_full_parse(csv_logger)
+
+        assert len(csv_logger._live_games) == csv_logger.LIVE_CACHE_ROWS
+        assert set(csv_logger._latest_by_game) == set(csv_logger._games_by_id)
+
+
+def test_cold_start_reads_only_the_tail_of_a_large_log():
+    """A fresh reader on a log bigger than LIVE_TAIL_BYTES seeks to the tail"""
+    with tempfile.TemporaryDirectory() as tmp:
+        live_log_path = Path(tmp) / "live.csv"
+        writer = make_logger(live_log_path)
+        for n in range(300):
+            writer.log_live_poll(poll(f"g{n % 7}", n))
+
+        csv_logger = make_logger(live_log_path)
+        csv_logger.LIVE_TAIL_BYTES = 4096
+        assert live_log_path.stat().st_size > csv_logger.LIVE_TAIL_BYTES
+
+        rows = full_parse(live_log_path)
+        tail = csv_logger.get_recent_games(limit=len(rows))
+        # Only whole rows from the last LIVE_TAIL_BYTES, under the real header
+        assert 0 < len(tail) < len(rows)
+        assert tail == rows[-len(tail):]
+
+        # Later appends continue from the offset reached after the seek
+        writer.log_live_poll(poll("g-new", 300))
+        assert csv_logger.get_recent_games(limit=len(rows))[-1] == full_parse(live_log_path)[-1]
+        assert len(csv_logger.get_recent_games(limit=len(rows))) == len(tail) + 1
+
+
+if __name__ == "__main__":
+    test_partial_row_is_picked_up_once_finished()
+    test_replaced_or_truncated_file_is_reloaded()
+    test_trimming_keeps_game_indexes_consistent()
+    test_cold_start_reads_only_the_tail_of_a_large_log()
+    print("CSV logger live tail matches a full re-parse")
@@ -0,0 +1,115 @@
+"""
+Test script for the PPM threshold sweep
+"""
+import random
+
+from utils.ppm_analyzer import PPMAnalyzer
+
+# Rounded fields can differ in the last digit (sums run in a different order)
+TOLERANCES = {
+    'win_rate': 0.01,
+    'avg_confidence': 0.1,
+    'avg_units': 0.01,
+    'total_units_wagered': 0.01,
+    'total_profit': 0.01,
+    'roi': 0.01,
+}
+
+
+def reference_bucket(logs, results_by_game, ppm_threshold):
+    """The per-threshold loop _analyze_buckets replaced: rescan every log"""
+    hits = []
+    for log in logs:
+        try:
+            required_ppm = float(log.get('required_ppm', 0))
+        except (ValueError, TypeError):
+            continue
+
+        bet_type = log.get('bet_type', '').lower()
+        triggered = (
+            (bet_type == 'under' and required_ppm >= ppm_threshold)
+            or (bet_type == 'over' and required_ppm <= ppm_threshold)
+        )
+        if triggered and log.get('game_id') in results_by_game:
+            hits.append((log, results_by_game[log['game_id']]))
+
+    if not hits:
+        return {'triggers': 0, 'win_rate': 0, 'avg_confidence': 0, 'avg_units': 0, 'total_profit': 0, 'roi': 0}
+
+    triggers = len(hits)
+    wins = sum(1 for _, result in hits if result.get('outcome') == 'win')
+    losses = sum(1 for _, result in hits if result.get('outcome') == 'loss')
+    pushes = sum(1 for _, result in hits if result.get('outcome') == 'push')
+    total_confidence = sum(float(log.get('confidence_score', 0)) for log, _ in hits)
+    total_units = sum(float(log.get('unit_size', 0)) for log, _ in hits)
+    total_profit = sum(float(result.get('unit_profit', 0)) for _, result in hits)
+
+    win_rate = (wins / (wins + losses) * 100) if (wins + losses) > 0 else 0
+    roi = (total_profit / total_units * 100) if total_units > 0 else 0
+
+    return {
+        'triggers': triggers,
+        'wins': wins,
+        'losses': losses,
+        'pushes': pushes,
+        'win_rate': round(win_rate, 2),
+        'avg_confidence': round(total_confidence / triggers, 1),
+        'avg_units': round(total_units / triggers, 2),
+        'total_units_wagered': round(total_units, 2),
+        'total_profit': round(total_profit, 2),
+        'roi': round(roi, 2)
+    }
+
+
+def random_case(rng):
+    """Random logs/results, including blank, NaN and off-grid required PPMs"""
+    results_by_game = {
+        f"g{i}": {
+            'game_id': f"g{i}",
+            'outcome': rng.choice(['win', 'loss', 'push', '']),
+            'unit_profit': str(rng.choice([1, -1.1, 0, 2.5, -0.55]))
+        }
+        for i in range(rng.randint(1, 15))
+    }
+    logs = [
+        {
+            'game_id': f"g{rng.randint(0, 20)}",
+            'bet_type': rng.choice(['UNDER', 'under', 'over', 'Over', '', 'x']),
+            'required_ppm': rng.choice([
+                str(round(rng.uniform(0, 11), 1)),  # lands exactly on a bucket
+                str(rng.uniform(0, 11)),
+                '',
+                'nan',
+            ]),
+            'confidence_score': str(rng.randint(0, 100)),
+            'unit_size': str(rng.choice([0, 0.5, 1, 2, 3])),
+        }
+        for _ in range(rng.randint(1, 40))
+    ]
+    return logs, results_by_game
+
+
+def test_sweep_matches_per_threshold_loop():
+    """_analyze_buckets agrees with rescanning the logs for every threshold"""
+    analyzer = PPMAnalyzer()
+    rng = random.Random(2000)
+
+    for case in range(2000):
+        logs, results_by_game = random_case(rng)
+        analysis = analyzer._analyze_buckets(logs, results_by_game)
+
+        for threshold in analyzer.ppm_buckets:
+            expected = reference_bucket(logs, results_by_game, threshold)
+            actual = analysis[threshold]
+
+            assert actual.keys() == expected.keys(), (case, threshold)
+            for key, value in expected.items():
+                if key in TOLERANCES:
+                    assert abs(actual[key] - value) <= TOLERANCES[key] + 1e-9, (case, threshold, key)
+                else:
+                    assert actual[key] == value, (case, threshold, key)
+
+
+if __name__ == "__main__":
+    test_sweep_matches_per_threshold_loop()
+    print("PPM sweep matches the per-threshold loop")
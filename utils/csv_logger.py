@@ -3,20 +3,137 @@ CSV Logging System
 Logs live game polls and end-of-game results
 """
 import csv
+import io
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 from loguru import logger
 import config
 
+# Results log our_trigger cell values meaning "we bet this game"
+OUR_TRIGGER_TRUE = frozenset({"True", "TRUE", "true", "1"})
+
+# Live log Trigger (current "YES") / legacy trigger_flag ("True", "1") values
+# meaning the poll triggered
+LIVE_TRIGGER_TRUE = frozenset(("YES", "True", True, "1"))
+
+
+def _to_float(value, default: float = 0.0) -> float:
+    """Parse a CSV cell as float, treating blanks/garbage as default"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _to_int(value) -> int:
+    """Parse a CSV cell as int (via float), treating blanks/garbage as 0"""
+    return int(_to_float(value))
+
+
+# Normalized live log field -> (current CSV column, legacy column, default when blank)
+LIVE_LOG_FIELDS = (
+    ("game_id", "Game ID", "game_id", None),
+    ("home_team", "Team 2", "home_team", None),
+    ("away_team", "Team 1", "away_team", None),
+    ("home_score", "Score 2", "home_score", None),
+    ("away_score", "Score 1", "away_score", None),
+    ("period", "Period", "period", None),
+    ("minutes_remaining", "Mins Remaining", "minutes_remaining", None),
+    ("seconds_remaining", "Secs Remaining", "seconds_remaining", None),
+    ("ou_line", "OU Line", "ou_line", None),
+    ("espn_closing_total", "ESPN Closing Total", "espn_closing_total", None),
+    ("required_ppm", "Required PPM", "required_ppm", None),
+    ("current_ppm", "Current PPM", "current_ppm", None),
+    ("ppm_difference", "PPM Diff", "ppm_difference", None),
+    ("projected_final_score", "Projected Final", "projected_final_score", None),
+    ("total_time_remaining", "Total Time Left", "total_time_remaining", None),
+    ("bet_type", "Bet Type", "bet_type", ""),
+    ("confidence_score", "Confidence", "confidence_score", 0),
+    ("unit_size", "Units", "unit_size", 0),
+    ("timestamp", "Timestamp", "timestamp", None),
+)
+
+
+def _make_live_row_normalizer(current_schema: bool):
+    """
+    Build a row normalizer specialized for one live log CSV schema
+
+    Resolving the column names up front means each field costs a single
+    dict lookup per row instead of trying both column names.
+    """
+    pick = 1 if current_schema else 2
+    columns = tuple((field[0], field[pick], field[3]) for field in LIVE_LOG_FIELDS)
+    away_col, home_col = ("Score 1", "Score 2") if current_schema else ("away_score", "home_score")
+    trigger_col = "Trigger" if current_schema else "trigger_flag"
+
+    def normalize(row: Dict) -> Dict:
+        get = row.get
+        normalized = {out: get(col) or default for out, col, default in columns}
+        normalized["total_points"] = _to_int(get(away_col)) + _to_int(get(home_col))
+        normalized["trigger_flag"] = get(trigger_col) in LIVE_TRIGGER_TRUE
+        return normalized
+
+    return normalize
+
+
+# Normalizers keyed by whether a row uses the current column names
+_LIVE_ROW_NORMALIZERS = {
+    True: _make_live_row_normalizer(current_schema=True),
+    False: _make_live_row_normalizer(current_schema=False),
+}
+
+
+def normalize_live_row(row: Dict) -> Dict:
+    """Map a raw live log row (either schema) to the frontend's field names"""
+    return _LIVE_ROW_NORMALIZERS["Game ID" in row](row)
+
+
+def _timestamp_key(game: Dict) -> str:
+    """Sort key for a normalized live row's timestamp (blank sorts first)"""
+    return game["timestamp"] or ""
+
 
 class CSVLogger:
     """Handles CSV logging for live polls and game results"""
 
+    # Most recent live log rows kept in memory (largest API window is 5000)
+    LIVE_CACHE_ROWS = 5000
+
+    # A cold start on a bigger log only parses this many trailing bytes,
+    # comfortably more than LIVE_CACHE_ROWS rows
+    LIVE_TAIL_BYTES = LIVE_CACHE_ROWS * 512
+
+    # Reuse the parsed tail without even stat()ing the file for this long;
+    # rows the monitor process appends reach API readers within this delay
+    LIVE_REFRESH_SECONDS = 1.0
+
     def __init__(self):
         self.live_log_path = config.LIVE_LOG_FILE
         self.results_path = config.RESULTS_FILE
 
+        # Tail of the parsed live log plus the byte offset parsed so far, so
+        # each refresh only parses rows appended since the previous one.
+        # Rows are kept only as normalize_live_row(row), so scores and column
+        # aliases are resolved once per row at read time.
+        self._live_games: list = []
+        self._live_fieldnames: Optional[list] = None
+        self._live_offset = 0
+        self._live_signature = None
+        self._live_checked_at = 0.0
+
+        # Most recent normalized live log row per game, updated as rows are parsed
+        self._latest_by_game: Dict[str, Dict] = {}
+
+        # Cached normalized rows per game in log order, trimmed with the tail
+        self._games_by_id: Dict[str, deque] = {}
+
+        # API endpoints read the cache from worker threads
+        self._live_lock = threading.Lock()
+
         # Initialize CSV files with headers if they don't exist
         self._init_live_log()
         self._init_results_log()
@@ -201,17 +318,142 @@ class CSVLogger:
         except Exception as e:
             logger.error(f"Error logging game result: {e}")
 
-    def get_recent_logs(self, limit: int = 100) -> list:
-        """Get recent live log entries"""
+    def _load_live_rows(self) -> list:
+        """
+        Return the cached, normalized live log tail, parsing only newly appended rows
+
+        Caller must hold self._live_lock.
+        """
+        # Concurrent dashboard requests within the refresh window share one check
+        now = time.monotonic()
+        if self._live_signature is not None and now - self._live_checked_at < self.LIVE_REFRESH_SECONDS:
+            return self._live_games
+
+        stat = self.live_log_path.stat()
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        if signature == self._live_signature:
+            self._live_checked_at = now
+            return self._live_games
+
+        # File replaced or truncated: start over from the header
+        if (
+            self._live_signature is None
+            or stat.st_ino != self._live_signature[0]
+            or stat.st_size < self._live_offset
+        ):
+            self._live_games = []
+            self._live_fieldnames = None
+            self._live_offset = 0
+            self._latest_by_game = {}
+            self._games_by_id = {}
+
+        start = self._live_offset
+        with open(self.live_log_path, 'rb') as f:
+            if start == 0 and stat.st_size > self.LIVE_TAIL_BYTES:
+                # Cold start on a large log: read the header, then jump to the
+                # tail instead of parsing history that would be trimmed anyway
+                self._live_fieldnames = next(csv.reader([f.readline().decode('utf-8')]))
+                f.seek(stat.st_size - self.LIVE_TAIL_BYTES)
+                f.readline()  # skip the partial row the seek landed in
+                start = f.tell()
+            else:
+                f.seek(start)
+            chunk = f.read()
+
+        # Only consume complete lines; a row still being written is picked up next time
+        end = chunk.rfind(b'\n') + 1
+        if end:
+            reader = csv.DictReader(
+                io.StringIO(chunk[:end].decode('utf-8'), newline=''),
+                fieldnames=self._live_fieldnames
+            )
+            # Normalize once here so readers never re-map or re-parse rows
+            new_games = [normalize_live_row(row) for row in reader]
+            self._live_fieldnames = reader.fieldnames
+            self._live_games.extend(new_games)
+            self._live_offset = start + end
+
+            latest = self._latest_by_game
+            by_id = self._games_by_id
+            for game in new_games:
+                game_id = game["game_id"]
+
+                game_rows = by_id.get(game_id)
+                if game_rows is None:
+                    game_rows = by_id[game_id] = deque()
+                game_rows.append(game)
+
+                current = latest.get(game_id)
+                if current is None or _timestamp_key(game) > _timestamp_key(current):
+                    latest[game_id] = game
+
+            overflow = len(self._live_games) - self.LIVE_CACHE_ROWS
+            if overflow > 0:
+                # Trimmed rows are the oldest, so they sit at the front of
+                # each game's deque; a game with no rows left in the tail
+                # drops out of both indexes
+                for game in self._live_games[:overflow]:
+                    game_id = game["game_id"]
+                    game_rows = by_id[game_id]
+                    game_rows.popleft()
+                    if not game_rows:
+                        del by_id[game_id]
+                        latest.pop(game_id, None)
+                    elif latest.get(game_id) is game:
+                        # An out-of-order timestamp made this row the latest
+                        latest[game_id] = max(game_rows, key=_timestamp_key)
+                del self._live_games[:overflow]
+
+        self._live_signature = signature
+        self._live_checked_at = now
+        return self._live_games
+
+    def get_recent_games(self, limit: int = 100) -> list:
+        """
+        Get recent live log entries normalized with normalize_live_row
+
+        At most LIVE_CACHE_ROWS rows are available. Rows are shared between
+        callers, so treat them as read-only.
+        """
         try:
-            with open(self.live_log_path, 'r') as f:
-                reader = csv.DictReader(f)
-                logs = list(reader)
-                return logs[-limit:] if len(logs) > limit else logs
+            with self._live_lock:
+                return self._load_live_rows()[-limit:]
         except Exception as e:
             logger.error(f"Error reading live logs: {e}")
             return []
 
+    def get_logs_for_game(self, game_id: str, limit: Optional[int] = None) -> list:
+        """
+        Get cached live log entries for one game, normalized, in log order
+
+        Looks the game up in an index maintained as rows are parsed, so no
+        scan of the tail is needed. Rows are shared, treat them as read-only.
+        """
+        try:
+            with self._live_lock:
+                self._load_live_rows()
+                game_rows = list(self._games_by_id.get(game_id, ()))
+        except Exception as e:
+            logger.error(f"Error reading live logs: {e}")
+            return []
+
+        return game_rows[-limit:] if limit else game_rows
+
+    def get_latest_by_game(self) -> Dict[str, Dict]:
+        """
+        Get the most recent live log row for every game in the cached tail
+
+        Returns a snapshot dict of game_id -> row normalized with
+        normalize_live_row (rows are read-only).
+        """
+        with self._live_lock:
+            try:
+                self._load_live_rows()
+            except Exception as e:
+                logger.error(f"Error reading live logs: {e}")
+            return dict(self._latest_by_game)
+
     def get_results(self, limit: Optional[int] = None) -> list:
         """Get game results"""
         try:
@@ -225,6 +467,24 @@ class CSVLogger:
             logger.error(f"Error reading results: {e}")
             return []
 
+    def _load_typed_results(self) -> list:
+        """
+        Load results with the columns used for analytics parsed once
+
+        Numeric columns become floats and our_trigger becomes a bool here,
+        so the aggregation code never re-parses the same string.
+        """
+        typed = []
+        for r in self.get_results():
+            typed.append({
+                "outcome": r.get("outcome", ""),
+                "our_trigger": r.get("our_trigger") in OUR_TRIGGER_TRUE,
+                "max_confidence": _to_float(r.get("max_confidence")),
+                "max_units": _to_float(r.get("max_units")),
+                "unit_profit": _to_float(r.get("unit_profit")),
+            })
+        return typed
+
     def get_performance_stats(self) -> Dict:
         """
         Calculate performance statistics from results
@@ -232,7 +492,7 @@ class CSVLogger:
         Returns:
             Dict with win rates, ROI, etc.
         """
-        results = self.get_results()
+        results = self._load_typed_results()
 
         if not results:
             return {
@@ -247,21 +507,6 @@ class CSVLogger:
                 "by_confidence": {}
             }
 
-        # Filter to only games we bet on
-        bets = [r for r in results if r.get("our_trigger") == "True"]
-
-        total_bets = len(bets)
-        wins = len([r for r in bets if r.get("outcome") == "win"])
-        losses = len([r for r in bets if r.get("outcome") == "loss"])
-        pushes = len([r for r in bets if r.get("outcome") == "push"])
-
-        win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
-
-        total_units_wagered = sum(float(r.get("max_units", 0)) for r in bets)
-        total_unit_profit = sum(float(r.get("unit_profit", 0)) for r in bets)
-
-        roi = (total_unit_profit / total_units_wagered * 100) if total_units_wagered > 0 else 0
-
         # Performance by confidence tier
         by_confidence = {
             "low (41-60)": {"bets": 0, "wins": 0, "profit": 0},
@@ -270,8 +515,26 @@ class CSVLogger:
             "max (86-100)": {"bets": 0, "wins": 0, "profit": 0}
         }
 
-        for bet in bets:
-            conf = float(bet.get("max_confidence", 0))
+        # Overall and per-tier tallies in a single pass over the games we bet on
+        outcome_counts = {"win": 0, "loss": 0, "push": 0}
+        total_bets = 0
+        total_units_wagered = 0.0
+        total_unit_profit = 0.0
+
+        for bet in results:
+            if not bet["our_trigger"]:
+                continue
+
+            outcome = bet["outcome"]
+            profit = bet["unit_profit"]
+
+            total_bets += 1
+            if outcome in outcome_counts:
+                outcome_counts[outcome] += 1
+            total_units_wagered += bet["max_units"]
+            total_unit_profit += profit
+
+            conf = bet["max_confidence"]
             tier = None
 
             if 41 <= conf <= 60:
@@ -285,9 +548,17 @@ class CSVLogger:
 
             if tier:
                 by_confidence[tier]["bets"] += 1
-                if bet.get("outcome") == "win":
+                if outcome == "win":
                     by_confidence[tier]["wins"] += 1
-                by_confidence[tier]["profit"] += float(bet.get("unit_profit", 0))
+                by_confidence[tier]["profit"] += profit
+
+        wins = outcome_counts["win"]
+        losses = outcome_counts["loss"]
+        pushes = outcome_counts["push"]
+
+        win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
+
+        roi = (total_unit_profit / total_units_wagered * 100) if total_units_wagered > 0 else 0
 
         # Calculate win rates for each tier
         for tier in by_confidence:
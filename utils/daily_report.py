@@ -11,6 +11,10 @@ from email.mime.multipart import MIMEMultipart
 from loguru import logger
 import config
 
+# Left-closed confidence tier edges for pd.cut
+CONFIDENCE_TIER_BINS = [float('-inf'), 41, 61, 76, 86, float('inf')]
+CONFIDENCE_TIER_LABELS = ['NO BET', 'LOW', 'MEDIUM', 'HIGH', 'MAX']
+
 
 class DailyReportGenerator:
     """Generates and emails daily performance reports"""
@@ -74,27 +78,32 @@ class DailyReportGenerator:
             total_units_profit = triggered_games['unit_profit'].sum()
             roi = (total_units_profit / total_units_risked * 100) if total_units_risked > 0 else 0
 
-            # Breakdown by confidence tier
-            def get_confidence_tier(score):
-                if score >= 86: return 'MAX'
-                if score >= 76: return 'HIGH'
-                if score >= 61: return 'MEDIUM'
-                if score >= 41: return 'LOW'
-                return 'NO BET'
-
-            triggered_games['tier'] = triggered_games['max_confidence'].apply(get_confidence_tier)
-            by_confidence = triggered_games.groupby('tier').agg({
-                'outcome': lambda x: (x == 'win').sum(),
-                'max_units': 'sum',
-                'unit_profit': 'sum'
-            }).to_dict('index')
-
-            # Breakdown by bet type
-            by_bet_type = triggered_games.groupby('our_trigger').agg({
-                'outcome': lambda x: (x == 'win').sum(),
-                'max_units': 'sum',
-                'unit_profit': 'sum'
-            }).to_dict('index')
+            # Breakdown by confidence tier, bucketed in one pd.cut call
+            # (<41 NO BET, 41-60 LOW, 61-75 MEDIUM, 76-85 HIGH, 86+ MAX)
+            tiers = pd.cut(
+                triggered_games['max_confidence'].fillna(0),
+                bins=CONFIDENCE_TIER_BINS,
+                labels=CONFIDENCE_TIER_LABELS,
+                right=False
+            )
+            by_confidence = triggered_games.assign(
+                tier=tiers,
+                is_win=triggered_games['outcome'] == 'win'
+            ).groupby('tier', observed=True).agg(
+                outcome=('is_win', 'sum'),
+                max_units=('max_units', 'sum'),
+                unit_profit=('unit_profit', 'sum')
+            ).to_dict('index')
+
+            # Breakdown by bet type (wins summed from a precomputed boolean
+            # column so the groupby runs as a native sum, not a Python lambda)
+            by_bet_type = triggered_games.assign(
+                is_win=triggered_games['outcome'] == 'win'
+            ).groupby('our_trigger').agg(
+                outcome=('is_win', 'sum'),
+                max_units=('max_units', 'sum'),
+                unit_profit=('unit_profit', 'sum')
+            ).to_dict('index')
 
             # Best and worst games
             best_games = triggered_games.nlargest(3, 'unit_profit')[[
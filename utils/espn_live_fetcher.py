@@ -3,6 +3,7 @@ ESPN Live Game Fetcher
 Fetches live scores and game time directly from ESPN's unofficial scoreboard API
 """
 import requests
+import orjson
 from typing import Dict, List, Optional
 from datetime import datetime
 from loguru import logger
@@ -48,7 +49,7 @@ class ESPNLiveFetcher:
             response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             games = []
 
             # Parse events
@@ -3,6 +3,7 @@ ESPN Odds Fetcher
 Fetches betting odds (opening/closing lines) from ESPN's game summary API
 """
 import requests
+import orjson
 from typing import Dict, Optional
 from loguru import logger
 
@@ -37,12 +38,12 @@ class ESPNOddsFetcher:
             response = self.session.get(self.SUMMARY_URL, params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Extract odds from pickcenter
             pickcenter = data.get('pickcenter', [])
             if not pickcenter or len(pickcenter) == 0:
-                logger.debug(f"No odds data available for game {game_id}")
+                logger.debug("No odds data available for game {}", game_id)
                 return None
 
             odds_data = pickcenter[0]
@@ -92,7 +93,7 @@ class ESPNOddsFetcher:
                 'opening_spread': opening_spread
             }
 
-            logger.debug(f"Fetched odds for game {game_id}: {result}")
+            logger.debug("Fetched odds for game {}: {}", game_id, result)
             return result
 
         except Exception as e:
@@ -3,12 +3,15 @@ PPM Threshold Analysis System
 Analyzes performance at different PPM trigger thresholds to optimize the model
 """
 import csv
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 from collections import defaultdict
+from operator import itemgetter
 from loguru import logger
 import config
+from utils.csv_logger import LIVE_TRIGGER_TRUE, _to_float
 
 
 class PPMAnalyzer:
@@ -51,11 +54,13 @@ class PPMAnalyzer:
         # Analyze each PPM bucket
         analysis = {}
 
-        for ppm_threshold in self.ppm_buckets:
-            bucket_data = self._analyze_bucket(
-                logs, results_by_game, ppm_threshold
-            )
-            analysis[ppm_threshold] = bucket_data
+        if not logs or not results_by_game:
+            # Nothing can trigger without both polls and outcomes, so skip
+            # scanning the logs once per bucket
+            for ppm_threshold in self.ppm_buckets:
+                analysis[ppm_threshold] = self._empty_bucket()
+        else:
+            analysis = self._analyze_buckets(logs, results_by_game)
 
         # Calculate optimal threshold
         optimal = self._find_optimal_threshold(analysis)
@@ -67,61 +72,90 @@ class PPMAnalyzer:
             'by_threshold': analysis
         }
 
-    def _analyze_bucket(
-        self,
-        logs: List[Dict],
-        results_by_game: Dict,
-        ppm_threshold: float
-    ) -> Dict:
-        """Analyze performance for a specific PPM threshold"""
+    def _analyze_buckets(self, logs: List[Dict], results_by_game: Dict) -> Dict:
+        """
+        Analyze performance for every PPM threshold in one pass over the logs
 
-        # Find all instances where this threshold was hit
-        threshold_hits = []
+        An under bet triggers at every threshold <= its required PPM and an
+        over bet at every threshold >= it. With each side sorted by required
+        PPM, a threshold's hits are a suffix (under) or prefix (over) of the
+        sorted rows, so running totals plus a bisect give each bucket without
+        rescanning the logs.
+        """
+        sides = {'under': [], 'over': []}
 
         for log in logs:
             try:
                 required_ppm = float(log.get('required_ppm', 0))
-                bet_type = log.get('bet_type', '').lower()
-                game_id = log.get('game_id')
-
-                # Check if this would trigger at this threshold
-                triggered = False
-                if bet_type == 'under' and required_ppm >= ppm_threshold:
-                    triggered = True
-                elif bet_type == 'over' and required_ppm <= ppm_threshold:
-                    triggered = True
-
-                if triggered and game_id in results_by_game:
-                    threshold_hits.append({
-                        'log': log,
-                        'result': results_by_game[game_id]
-                    })
             except (ValueError, TypeError):
                 continue
 
-        if not threshold_hits:
-            return {
-                'triggers': 0,
-                'win_rate': 0,
-                'avg_confidence': 0,
-                'avg_units': 0,
-                'total_profit': 0,
-                'roi': 0
-            }
+            rows = sides.get((log.get('bet_type') or '').lower())
+            game_id = log.get('game_id')
+
+            # NaN never compares true against a threshold
+            if rows is None or game_id not in results_by_game or required_ppm != required_ppm:
+                continue
+
+            result = results_by_game[game_id]
+            outcome = result.get('outcome')
+            rows.append((
+                required_ppm,
+                outcome == 'win',
+                outcome == 'loss',
+                outcome == 'push',
+                # Parsed for every candidate row, including ones no threshold
+                # triggers, so blanks/garbage must not raise here
+                _to_float(log.get('confidence_score', 0)),
+                _to_float(log.get('unit_size', 0)),
+                _to_float(result.get('unit_profit', 0))
+            ))
+
+        # Per side: running hit totals, accumulated from the end that always triggers
+        sweeps = {}
+        for bet_type, rows in sides.items():
+            rows.sort(key=itemgetter(0), reverse=(bet_type == 'under'))
+            totals = [(0, 0, 0, 0, 0.0, 0.0, 0.0)]
+            for _, win, loss, push, confidence, units, profit in rows:
+                t = totals[-1]
+                totals.append((
+                    t[0] + 1, t[1] + win, t[2] + loss, t[3] + push,
+                    t[4] + confidence, t[5] + units, t[6] + profit
+                ))
+            sweeps[bet_type] = ([row[0] for row in rows], totals)
+
+        # bisect needs ascending keys, so search the negated under PPMs
+        under_keys, under_totals = sweeps['under']
+        under_keys = [-ppm for ppm in under_keys]
+        over_keys, over_totals = sweeps['over']
 
-        # Calculate metrics
-        triggers = len(threshold_hits)
-        wins = sum(1 for h in threshold_hits if h['result'].get('outcome') == 'win')
-        losses = sum(1 for h in threshold_hits if h['result'].get('outcome') == 'loss')
-        pushes = sum(1 for h in threshold_hits if h['result'].get('outcome') == 'push')
+        analysis = {}
+        for ppm_threshold in self.ppm_buckets:
+            # Under triggers when required_ppm >= threshold (-ppm <= -threshold)
+            under_hits = under_totals[bisect_right(under_keys, -ppm_threshold)]
+            # Over triggers when required_ppm <= threshold
+            over_hits = over_totals[bisect_right(over_keys, ppm_threshold)]
+            hits = [under + over for under, over in zip(under_hits, over_hits)]
+            analysis[ppm_threshold] = self._bucket_stats(*hits)
 
-        total_confidence = sum(float(h['log'].get('confidence_score', 0)) for h in threshold_hits)
-        avg_confidence = total_confidence / triggers if triggers > 0 else 0
+        return analysis
 
-        total_units = sum(float(h['log'].get('unit_size', 0)) for h in threshold_hits)
-        avg_units = total_units / triggers if triggers > 0 else 0
+    def _bucket_stats(
+        self,
+        triggers: int,
+        wins: int,
+        losses: int,
+        pushes: int,
+        total_confidence: float,
+        total_units: float,
+        total_profit: float
+    ) -> Dict:
+        """Bucket stats from a threshold's summed hits"""
+        if not triggers:
+            return self._empty_bucket()
 
-        total_profit = sum(float(h['result'].get('unit_profit', 0)) for h in threshold_hits)
+        avg_confidence = total_confidence / triggers
+        avg_units = total_units / triggers
 
         win_rate = (wins / (wins + losses) * 100) if (wins + losses) > 0 else 0
         roi = (total_profit / total_units * 100) if total_units > 0 else 0
@@ -139,6 +173,17 @@ class PPMAnalyzer:
             'roi': round(roi, 2)
         }
 
+    def _empty_bucket(self) -> Dict:
+        """Bucket stats for a threshold with no triggers"""
+        return {
+            'triggers': 0,
+            'win_rate': 0,
+            'avg_confidence': 0,
+            'avg_units': 0,
+            'total_profit': 0,
+            'roi': 0
+        }
+
     def _find_optimal_threshold(self, analysis: Dict) -> Dict:
         """
         Find the optimal PPM threshold based on multiple criteria
@@ -210,18 +255,17 @@ class PPMAnalyzer:
         if date is None:
             date = datetime.now()
 
-        # Get all logs for this date
+        # Get all logs for this date. Timestamps are ISO-8601, so the date
+        # is the first 10 characters and no per-row parsing is needed
+        day_iso = date.date().isoformat()
         logs = []
         try:
             with open(self.live_log_path, 'r') as f:
                 reader = csv.DictReader(f)
                 for log in reader:
-                    try:
-                        log_date = datetime.fromisoformat(log['timestamp']).date()
-                        if log_date == date.date():
-                            logs.append(log)
-                    except:
-                        continue
+                    timestamp = log.get('timestamp')
+                    if timestamp and timestamp[:10] == day_iso:
+                        logs.append(log)
         except FileNotFoundError:
             logger.warning(f"Live log file not found: {self.live_log_path}")
             return {}
@@ -282,7 +326,7 @@ class PPMAnalyzer:
                 continue
 
         # Check if triggered
-        triggered = any(log.get('trigger_flag') in ['True', True, '1'] for log in game_logs)
+        triggered = any(log.get('trigger_flag') in LIVE_TRIGGER_TRUE for log in game_logs)
 
         # Get max confidence
         max_confidence = 0
@@ -347,17 +391,17 @@ class PPMAnalyzer:
 
     def _load_logs_since(self, cutoff_date: datetime) -> List[Dict]:
         """Load all logs since cutoff date"""
+        # Naive ISO-8601 timestamps sort lexicographically, so compare strings
+        # instead of parsing a datetime per row
+        cutoff_iso = cutoff_date.isoformat()
         logs = []
         try:
             with open(self.live_log_path, 'r') as f:
                 reader = csv.DictReader(f)
                 for log in reader:
-                    try:
-                        log_date = datetime.fromisoformat(log['timestamp'])
-                        if log_date >= cutoff_date:
-                            logs.append(log)
-                    except:
-                        continue
+                    timestamp = log.get('timestamp')
+                    if timestamp and timestamp >= cutoff_iso:
+                        logs.append(log)
         except FileNotFoundError:
             logger.warning(f"Live log file not found: {self.live_log_path}")
 
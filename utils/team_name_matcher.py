@@ -128,7 +128,7 @@ class TeamNameMatcher:
             data = {k: list(v) for k, v in self.mappings.items()}
             with open(self.mappings_file, 'w') as f:
                 json.dump(data, f, indent=2)
-            logger.debug(f"Saved {len(self.mappings)} team mappings")
+            logger.debug("Saved {} team mappings", len(self.mappings))
         except Exception as e:
             logger.error(f"Error saving team mappings: {e}")
 
@@ -227,7 +227,7 @@ class TeamNameMatcher:
         if name1_lower in self.odds_espn_map and name2_lower in self.odds_espn_map:
             # Both names are in the mapping, check if they map to the same ESPN name
             if self.odds_espn_map[name1_lower].lower() == self.odds_espn_map[name2_lower].lower():
-                logger.debug(f"CSV mapping match: '{name1}' <-> '{name2}'")
+                logger.debug("CSV mapping match: '{}' <-> '{}'", name1, name2)
                 return True
 
         # Check canonical names
@@ -257,7 +257,7 @@ class TeamNameMatcher:
             if norm1_has_qualifier != norm2_has_qualifier:
                 return False
 
-            logger.debug(f"Fuzzy match: '{name1}' <-> '{name2}' (score: {fuzzy_score})")
+            logger.debug("Fuzzy match: '{}' <-> '{}' (score: {})", name1, name2, fuzzy_score)
             return True
 
         # Partial matching for cases like "Duke" in "Duke Blue Devils"
@@ -272,7 +272,7 @@ class TeamNameMatcher:
                 remaining = longer[len(shorter):].strip()
                 # Allow mascots/common words but not other team identifiers like "state"
                 if not remaining or remaining in self.mascots:
-                    logger.debug(f"Partial match: '{name1}' <-> '{name2}'")
+                    logger.debug("Partial match: '{}' <-> '{}'", name1, name2)
                     return True
 
         return False
@@ -314,7 +314,7 @@ class TeamNameMatcher:
                 best_match = candidate
 
         if best_score >= threshold:
-            logger.debug(f"Best match for '{target_name}': '{best_match}' (score: {best_score})")
+            logger.debug("Best match for '{}': '{}' (score: {})", target_name, best_match, best_score)
             return best_match
 
         return None
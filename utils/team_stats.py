@@ -2,7 +2,9 @@
 Unified Team Stats Manager
 Switches between KenPom, ESPN (NCAA), and NBA based on configuration
 """
-from typing import Dict, Optional
+import threading
+import time
+from typing import Dict, Optional, Tuple
 from loguru import logger
 import config
 
@@ -15,7 +17,17 @@ from utils.team_stats_nba import get_nba_fetcher
 class TeamStatsManager:
     """Unified interface for team statistics regardless of sport/data source"""
 
+    # Standardized metrics are reused for this long before asking the fetcher again
+    METRICS_CACHE_TTL = 300
+    METRICS_CACHE_SIZE = 1024
+
     def __init__(self):
+        # team_name -> (expires_at, metrics or None)
+        self._metrics_cache: Dict[str, Tuple[float, Optional[Dict]]] = {}
+
+        # API endpoints read and refresh the cache from worker threads
+        self._metrics_lock = threading.Lock()
+
         # Determine sport mode
         self.sport_mode = config.SPORT_MODE
 
@@ -37,7 +49,11 @@ class TeamStatsManager:
     def fetch_all_stats(self, force_refresh: bool = False):
         """Fetch team statistics from configured source"""
         logger.info(f"Fetching team stats from {self.data_source}...")
-        return self.fetcher.fetch_team_stats(force_refresh=force_refresh)
+        stats = self.fetcher.fetch_team_stats(force_refresh=force_refresh)
+        # Fresh source data invalidates every memoized team
+        with self._metrics_lock:
+            self._metrics_cache.clear()
+        return stats
 
     def get_team_metrics(self, team_name: str) -> Optional[Dict]:
         """
@@ -53,7 +69,34 @@ class TeamStatsManager:
         - ft_rate: Free throw rate (if available)
         - to_rate: Turnover rate (if available)
         - data_source: "kenpom" or "espn"
+
+        Results (including misses) are memoized per team for
+        METRICS_CACHE_TTL seconds.
         """
+        now = time.monotonic()
+        with self._metrics_lock:
+            cached = self._metrics_cache.get(team_name)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        # Built outside the lock so a slow lookup doesn't block other teams
+        metrics = self._build_team_metrics(team_name)
+
+        with self._metrics_lock:
+            if len(self._metrics_cache) >= self.METRICS_CACHE_SIZE:
+                # Drop expired entries; if still full, evict the oldest insert
+                self._metrics_cache = {
+                    name: entry for name, entry in self._metrics_cache.items()
+                    if entry[0] > now
+                }
+                if len(self._metrics_cache) >= self.METRICS_CACHE_SIZE:
+                    del self._metrics_cache[next(iter(self._metrics_cache))]
+
+            self._metrics_cache[team_name] = (now + self.METRICS_CACHE_TTL, metrics)
+        return metrics
+
+    def _build_team_metrics(self, team_name: str) -> Optional[Dict]:
+        """Look up a team with the fetcher and standardize its metrics"""
         metrics = self.fetcher.get_team_metrics(team_name)
 
         if metrics is None:
@@ -177,7 +177,7 @@ class ESPNStatsFetcher:
         name_to_lookup = team_name
         if team_name.lower() in self.name_mapping:
             name_to_lookup = self.name_mapping[team_name.lower()]
-            logger.debug(f"Translated team name: '{team_name}' -> '{name_to_lookup}'")
+            logger.debug("Translated team name: '{}' -> '{}'", team_name, name_to_lookup)
 
         # Try to find team
         team_row = self._find_team(name_to_lookup)
@@ -269,7 +269,7 @@ class ESPNStatsFetcher:
                     odds_name = str(row['full_name']).strip().lower()
                     espn_name = str(row['espn_name']).strip()
                     mapping[odds_name] = espn_name
-                logger.debug(f"Loaded {len(df)} team name mappings for ESPN stats")
+                logger.debug("Loaded {} team name mappings for ESPN stats", len(df))
             except Exception as e:
                 logger.warning(f"Error loading team name mappings: {e}")
 